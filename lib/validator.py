@@ -1,5 +1,14 @@
 import xml.etree.ElementTree as ET
-import sys
+import gzip
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Largest (decompressed) document a Validator will read, in bytes
+MAX_DOCUMENT_SIZE = 64 * 1024 * 1024
 
 def validate_value(value, field_def):
     vtype = field_def['type']
@@ -24,15 +33,14 @@ def validate_value(value, field_def):
         return False, f"Expected boolean (true/false/1/0), got '{value}'"
         
     elif vtype == 'date' or field_def['original_type'] == 'xs:date':
-        import re
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+        if DATE_RE.match(value):
             return True, None
         return False, f"Expected ISO date (YYYY-MM-DD), got '{value}'"
 
     elif vtype == 'enum':
         if value in field_def['enum_values']:
             return True, None
-        return False, f"Value '{value}' not in allowed list: {field_def['enum_values']}"
+        return False, f"Value '{value}' not in allowed list: {list(field_def['enum_values'])}"
         
     return True, None
 
@@ -55,35 +63,57 @@ def validate_file(xml_path, schema, xsd_path=None):
         return [f"XML Parse Error: {e}"]
 
 def validate_element(element, type_name, schema, path=""):
+    return _validate_element(element, type_name, schema, _build_type_lookup(schema), path)
+
+def is_v11_document(root):
+    """Return True if a parsed root element looks like a BeerXML v1.1 document."""
+    # v1.1 namespace on the root, or a <VERSION>1.1</VERSION> anywhere below it
+    is_v11 = 'beerxml.com/v1.1' in root.tag or 'xmlns' in root.attrib and 'v1.1' in root.attrib['xmlns']
+    version_elem = root.find('.//VERSION')
+    if version_elem is not None and version_elem.text == '1.1':
+        is_v11 = True
+    return is_v11
+
+
+def _clean_tag(e):
+    # Tag name with any namespace stripped
+
+    return e.tag.split('}', 1)[1] if '}' in e.tag else e.tag
+
+def _normalize_type_name(name):
+    return name.upper().replace('_', '')
+
+def _build_type_lookup(schema):
+    # Match tag name to type name (case-insensitive, ignoring underscores).
+    # First key wins, same as scanning the schema in order.
+    lookup = {}
+    for key in schema:
+        lookup.setdefault(_normalize_type_name(key), key)
+    return lookup
+
+def _validate_element(element, type_name, schema, type_lookup, path):
     errors = []
-    
-    # Simple namespace stripping for children
-    def get_clean_tag(e):
-        return e.tag.split('}', 1)[1] if '}' in e.tag else e.tag
 
     definition = schema.get(type_name)
     if not definition:
-        # Match tag name to type name (case-insensitive, ignoring underscores)
-        clean_tag = get_clean_tag(element)
-        candidate = clean_tag.upper().replace('_', '')
-        for key in schema:
-            if key.upper().replace('_', '') == candidate:
-                definition = schema[key]
-                break
+        clean_tag = _clean_tag(element)
+        key = type_lookup.get(_normalize_type_name(clean_tag))
+        if key is not None:
+            definition = schema[key]
                 
         if not definition:
             for child in element:
-                child_errors = validate_element(child, get_clean_tag(child), schema, f"{path}/{clean_tag}")
+                child_errors = _validate_element(child, _clean_tag(child), schema, type_lookup, f"{path}/{clean_tag}")
                 errors.extend(child_errors)
             return errors
 
     if definition:
-        clean_tag = get_clean_tag(element)
+        clean_tag = _clean_tag(element)
         for field_name, field_def in definition.items():
             # Find child ignoring namespace
             child = None
             for c in element:
-                if get_clean_tag(c) == field_name:
+                if _clean_tag(c) == field_name:
                     child = c
                     break
             
@@ -91,7 +121,7 @@ def validate_element(element, type_name, schema, path=""):
                 errors.append(f"Missing required field: {path}/{clean_tag}/{field_name}")
         
         for child in element:
-            c_tag = get_clean_tag(child)
+            c_tag = _clean_tag(child)
             field_def = definition.get(c_tag)
             if field_def:
                 if child.text:
@@ -102,8 +132,91 @@ def validate_element(element, type_name, schema, path=""):
                 original = field_def['original_type']
                 if original.endswith('Type'):
                     subtype = original[:-4]
-                    child_errors = validate_element(child, subtype, schema, f"{path}/{clean_tag}")
+                    child_errors = _validate_element(child, subtype, schema, type_lookup, f"{path}/{clean_tag}")
                     errors.extend(child_errors)
     return errors
 
 
+def _freeze_schema(schema):
+    # Deep read-only copy of parse_xsd output so a Validator can be shared
+    # between threads without anyone mutating it underneath the others.
+    frozen = {}
+    for type_name, fields in schema.items():
+        frozen_fields = {}
+        for field_name, field_def in fields.items():
+            field_def = dict(field_def)
+            if field_def.get('enum_values') is not None:
+                field_def['enum_values'] = tuple(field_def['enum_values'])
+            frozen_fields[field_name] = MappingProxyType(field_def)
+        frozen[type_name] = MappingProxyType(frozen_fields)
+    return MappingProxyType(frozen)
+
+def _read_source(xml_path, max_size):
+    # Read (and decompress) the whole document up front. File reads and
+    # zlib both release the GIL, so in a thread pool this overlaps with
+    # other workers parsing and validating. Reading stops just past
+    # max_size, so a small .gz cannot expand into gigabytes in memory.
+    opener = gzip.open if str(xml_path).endswith('.gz') else open
+    with opener(xml_path, 'rb') as f:
+        data = f.read(max_size + 1)
+    if len(data) > max_size:
+        raise ValueError(f"{xml_path}: document exceeds {max_size} bytes")
+    return data
+
+
+class Validator:
+    """Reusable validator for one schema (the output of parse_xsd).
+
+    The schema is copied into read-only mappings on construction and the
+    instance cannot be modified afterwards, so a single Validator can be
+    shared freely between threads. Files larger than max_size bytes
+    (after decompression) are rejected with a "Read Error".
+    """
+
+    __slots__ = ('schema', 'max_size', '_type_lookup')
+
+    def __init__(self, schema, max_size=MAX_DOCUMENT_SIZE):
+        object.__setattr__(self, 'schema', _freeze_schema(schema))
+        object.__setattr__(self, 'max_size', max_size)
+        object.__setattr__(self, '_type_lookup', MappingProxyType(_build_type_lookup(self.schema)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def validate_element(self, element, type_name, path=""):
+        return _validate_element(element, type_name, self.schema, self._type_lookup, path)
+
+    def validate_bytes(self, data):
+        try:
+            root = ET.fromstring(data)
+        except ET.ParseError as e:
+            return [f"XML Parse Error: {e}"]
+        return self.validate_element(root, _clean_tag(root))
+
+    def validate_file(self, xml_path):
+        # Files ending in .gz are decompressed transparently. Read and
+        # decompress failures are reported like parse errors, so one bad
+        # file never takes down a whole validate_files batch.
+        try:
+            data = _read_source(xml_path, self.max_size)
+        except (OSError, EOFError, zlib.error, ValueError) as e:
+            return [f"Read Error: {e}"]
+        return self.validate_bytes(data)
+
+    def validate_files(self, xml_paths, max_workers=None):
+        """Validate many files on a thread pool.
+
+        Returns a list of error lists in the same order as xml_paths; a
+        file that cannot be read gets its own "Read Error" entry. Each
+        worker reads, decompresses, parses and validates one file, so I/O
+        of one file overlaps with parsing of the others.
+        """
+        xml_paths = list(xml_paths)
+        if max_workers == 1 or len(xml_paths) <= 1:
+            return [self.validate_file(p) for p in xml_paths]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.validate_file, xml_paths))
+
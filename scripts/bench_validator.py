@@ -0,0 +1,86 @@
+import argparse
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from lib.schema_parser import parse_xsd
+from lib.validator import Validator, is_v11_document
+
+def gil_enabled():
+    # sys._is_gil_enabled only exists on 3.13+; older builds always have a GIL.
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+def collect_samples(samples_dir):
+    # Only v1.0 files (detected like the test runner does), so every
+    # document goes through the same Validator
+    paths = []
+    for root, dirs, files in os.walk(samples_dir):
+        for file in files:
+            if file.endswith(".xml"):
+                path = os.path.join(root, file)
+                if not is_v11_document(ET.parse(path).getroot()):
+                    paths.append(path)
+    return sorted(paths)
+
+def make_corpus(paths, copies, work_dir, compress):
+    # Write each sample out `copies` times so there is real I/O to overlap
+    corpus = []
+    for i in range(copies):
+        for path in paths:
+            name = f"{i}_{os.path.basename(path)}"
+            if compress:
+                target = os.path.join(work_dir, name + ".gz")
+                with open(path, 'rb') as src, gzip.open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                target = os.path.join(work_dir, name)
+                shutil.copyfile(path, target)
+            corpus.append(target)
+    return corpus
+
+def time_run(validator, corpus, workers, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validator.validate_files(corpus, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Validator.validate_files across thread counts.")
+    parser.add_argument("--xsd", default="docs/spec/v1.0/beerxml-1.0.xsd")
+    parser.add_argument("--samples", default="samples")
+    parser.add_argument("--copies", type=int, default=50, help="Copies of each sample in the corpus")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma separated thread counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    parser.add_argument("--gzip", action="store_true", help="Store the corpus gzip-compressed")
+    args = parser.parse_args()
+
+    validator = Validator(parse_xsd(args.xsd))
+    worker_counts = [int(w) for w in args.workers.split(',')]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        corpus = make_corpus(collect_samples(args.samples), args.copies, work_dir, args.gzip)
+
+        print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, {os.cpu_count()} CPUs")
+        print(f"Corpus: {len(corpus)} files{' (gzip)' if args.gzip else ''}")
+        print(f"{'workers':>8} {'seconds':>10} {'files/s':>10} {'speedup':>8}")
+
+        baseline = None
+        for workers in worker_counts:
+            elapsed = time_run(validator, corpus, workers, args.repeat)
+            if baseline is None:
+                baseline = elapsed
+            print(f"{workers:>8} {elapsed:>10.3f} {len(corpus) / elapsed:>10.1f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,24 @@
+import gzip
+import operator
 import os
 import sys
+import tempfile
 import xml.etree.ElementTree as ET
 
 from lib.schema_parser import parse_xsd
-from lib.validator import validate_file
+from lib.validator import Validator, is_v11_document, validate_file
 
 def run_tests():
     xsd_v10 = "docs/spec/v1.0/beerxml-1.0.xsd"
     xsd_v11 = "docs/spec/v1.1/beerxml-1.1.xsd"
     samples_dir = "samples"
+    invalid_fixture = "tests/fixtures/invalid_hops_v1.0.xml"
     
     print("Parsing Schemas...")
     schema_v10 = parse_xsd(xsd_v10)
     schema_v11 = parse_xsd(xsd_v11)
+    validator_v10 = Validator(schema_v10)
+    validator_v11 = Validator(schema_v11)
     
     files_to_test = []
     for root, dirs, files in os.walk(samples_dir):
@@ -23,6 +29,7 @@ def run_tests():
     total = 0
     passed = 0
     failed = 0
+    results = {}
     
     for file_path in files_to_test:
         total += 1
@@ -32,18 +39,13 @@ def run_tests():
         try:
             tree = ET.parse(file_path)
             root = tree.getroot()
-            
-            # Heuristic for version detection
-            is_v11 = 'beerxml.com/v1.1' in root.tag or 'xmlns' in root.attrib and 'v1.1' in root.attrib['xmlns']
-            # Also check <VERSION> tag if present
-            version_elem = root.find('.//VERSION') # very rough
-            if version_elem is not None and version_elem.text == '1.1':
-                is_v11 = True
+            is_v11 = is_v11_document(root)
                 
-            schema = schema_v11 if is_v11 else schema_v10
+            validator = validator_v11 if is_v11 else validator_v10
             version_str = "v1.1" if is_v11 else "v1.0"
             
-            errors = validate_file(file_path, schema)
+            errors = validator.validate_file(file_path)
+            results[file_path] = (validator, errors)
             
             if not errors:
                 print(f"OK ({version_str})")
@@ -57,6 +59,20 @@ def run_tests():
             print(f"ERROR: {e}")
             failed += 1
             
+    # Checks of the Validator API itself, each counted as one test
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, problems in run_validator_checks(validator_v10, validator_v11, results, invalid_fixture, tmp_dir):
+            total += 1
+            print(f"Checking {name}...", end=" ")
+            if not problems:
+                print("OK")
+                passed += 1
+            else:
+                print("FAIL")
+                for p in problems:
+                    print(f"  - {p}")
+                failed += 1
+
     print("-" * 30)
     print(f"Total: {total}, Passed: {passed}, Failed: {failed}")
     
@@ -64,5 +80,124 @@ def run_tests():
         sys.exit(1)
 
 
+# Everything in samples/ is valid, so this fixture is what proves the
+# Validator reports the same errors as the module-level functions.
+INVALID_FIXTURE_ERRORS = [
+    "Missing required field: /HOPS/HOP/AMOUNT",
+    "Invalid value at /HOPS/HOP/VERSION: Expected integer, got 'one'",
+    "Invalid value at /HOPS/HOP/TYPE: Value 'Flavour' not in allowed list: ['Bittering', 'Aroma', 'Both']",
+]
+
+def run_validator_checks(validator_v10, validator_v11, results, invalid_fixture, tmp_dir):
+    # The validators are shared by every worker thread; the batch API must
+    # give exactly the same answers as validating one file at a time.
+    problems = []
+    for validator in (validator_v10, validator_v11):
+        paths = [p for p, (v, _) in results.items() if v is validator]
+        batch = paths * 4
+        for path, errors in zip(batch, validator.validate_files(batch, max_workers=8)):
+            if errors != results[path][1]:
+                problems.append(f"{path}: batch result differs from serial result")
+    yield "threaded batch validation", problems
+
+    problems = []
+    invalid_gz = os.path.join(tmp_dir, "invalid.xml.gz")
+    with open(invalid_fixture, 'rb') as f:
+        invalid_data = f.read()
+    with open(invalid_gz, 'wb') as f:
+        f.write(gzip.compress(invalid_data))
+    attempts = [
+        ("validate_file(path, schema)", validate_file(invalid_fixture, validator_v10.schema)),
+        ("Validator.validate_file", validator_v10.validate_file(invalid_fixture)),
+        ("Validator.validate_bytes", validator_v10.validate_bytes(invalid_data)),
+        ("Validator.validate_file on .gz", validator_v10.validate_file(invalid_gz)),
+    ]
+    batch = [invalid_fixture, invalid_gz] * 4
+    for path, errors in zip(batch, validator_v10.validate_files(batch, max_workers=8)):
+        attempts.append((f"Validator.validate_files on {os.path.basename(path)}", errors))
+    for label, errors in attempts:
+        if errors != INVALID_FIXTURE_ERRORS:
+            problems.append(f"{label}: got {errors}")
+    yield "errors reported for an invalid document", problems
+
+    # Gzipped copies must validate exactly like the plain files
+    problems = []
+    for validator in (validator_v10, validator_v11):
+        paths = [p for p, (v, _) in results.items() if v is validator]
+        gz_paths = []
+        for i, path in enumerate(paths):
+            gz_path = os.path.join(tmp_dir, f"{i}_{os.path.basename(path)}.gz")
+            with open(path, 'rb') as f:
+                data = f.read()
+            with open(gz_path, 'wb') as f:
+                f.write(gzip.compress(data))
+            gz_paths.append(gz_path)
+        for path, errors in zip(paths, validator.validate_files(gz_paths, max_workers=4)):
+            if errors != results[path][1]:
+                problems.append(f"{path}: gzip result differs from plain result")
+    yield "gzip decompression", problems
+
+    problems = []
+    for path, (validator, expected) in results.items():
+        with open(path, 'rb') as f:
+            if validator.validate_bytes(f.read()) != expected:
+                problems.append(f"{path}: validate_bytes result differs from validate_file")
+    errors = validator_v10.validate_bytes(b"<RECIPES><RECIPE>")
+    if len(errors) != 1 or not errors[0].startswith("XML Parse Error: "):
+        problems.append("malformed XML is not reported as a parse error")
+    yield "validate_bytes", problems
+
+    problems = []
+    type_name = next(iter(validator_v10.schema))
+    field_name = next(iter(validator_v10.schema[type_name]))
+    attempts = [
+        ("assign to instance", AttributeError, lambda: setattr(validator_v10, 'schema', {})),
+        ("delete from instance", AttributeError, lambda: delattr(validator_v10, 'schema')),
+        ("assign to schema", TypeError, lambda: operator.setitem(validator_v10.schema, type_name, {})),
+        ("assign to type", TypeError, lambda: operator.setitem(validator_v10.schema[type_name], field_name, {})),
+        ("assign to field", TypeError, lambda: operator.setitem(validator_v10.schema[type_name][field_name], 'required', False)),
+    ]
+    for label, exc_type, attempt in attempts:
+        try:
+            attempt()
+            problems.append(f"{label} did not raise")
+        except exc_type:
+            pass
+        except Exception as e:
+            problems.append(f"{label} raised {type(e).__name__} instead of {exc_type.__name__}")
+    yield "Validator immutability", problems
+
+    # One unreadable file must not take down the rest of the batch
+    problems = []
+    good_path = next(p for p, (v, _) in results.items() if v is validator_v10)
+    corrupt_gz = os.path.join(tmp_dir, "corrupt.xml.gz")
+    with open(corrupt_gz, 'wb') as f:
+        f.write(b"this is not gzip data")
+    truncated_gz = os.path.join(tmp_dir, "truncated.xml.gz")
+    with open(good_path, 'rb') as f:
+        compressed = gzip.compress(f.read())
+    with open(truncated_gz, 'wb') as f:
+        f.write(compressed[:len(compressed) // 2])
+    # Decompresses to just over the limit of a validator sized to good_path
+    with open(good_path, 'rb') as f:
+        good_data = f.read()
+    oversize_gz = os.path.join(tmp_dir, "oversize.xml.gz")
+    with open(oversize_gz, 'wb') as f:
+        f.write(gzip.compress(good_data + b" " * len(good_data)))
+    limited = Validator(validator_v10.schema, max_size=len(good_data))
+    bad_paths = [os.path.join(tmp_dir, "missing.xml"), corrupt_gz, truncated_gz, oversize_gz]
+    try:
+        batch = limited.validate_files([good_path] + bad_paths, max_workers=4)
+    except Exception as e:
+        problems.append(f"batch raised {type(e).__name__}: {e}")
+    else:
+        if batch[0] != results[good_path][1]:
+            problems.append(f"{good_path}: result changed by bad neighbours")
+        for path, errors in zip(bad_paths, batch[1:]):
+            if len(errors) != 1 or not errors[0].startswith("Read Error: "):
+                problems.append(f"{path}: expected one Read Error, got {errors}")
+    yield "unreadable files in a batch", problems
+
+
 if __name__ == "__main__":
     run_tests()